@@ -7,10 +7,46 @@
 import re
 
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from .config import Config
 from .parsed_data import ResultTree, Host, Vulnerability
 
+# characters not allowed in worksheet names, stripped from vuln names
+_SHEETNAME_BAD = re.compile(r"[\[\]\\\'\"&@#():*?/]")
+
+# whitespace flattened to plain spaces when a field is shown on one line
+_WS_TABLE = str.maketrans({'\n': ' ', '\r': ' ', '\t': ' '})
+
+# prebuilt run XML for plain paragraphs appended without the
+# python-docx Paragraph/Run proxy objects
+_DOCX_RUN_TEMPLATE = ('<w:r xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                      '<w:t xml:space="preserve">{}</w:t></w:r>')
+
+
+def _speed_up_workbook_zip():
+    """
+    Make xlsxwriter deflate its zip container at level 1 instead of the
+    zlib default (6). On big reports the deflate pass dominates
+    workbook.close(); level 1 is several times faster for ~10% larger
+    files. xlsxwriter exposes no option for this, so rebind the ZipFile
+    name its workbook module uses.
+    """
+    import xlsxwriter.workbook
+
+    if getattr(xlsxwriter.workbook.ZipFile, '_openvasreporting_fast', False):
+        return
+
+    class _FastZipFile(xlsxwriter.workbook.ZipFile):
+        _openvasreporting_fast = True
+
+        def __init__(self, *args, **kwargs):
+            kwargs.setdefault('compresslevel', 1)
+            super().__init__(*args, **kwargs)
+
+    xlsxwriter.workbook.ZipFile = _FastZipFile
+
 # DEBUG
 #import sys
 #import logging
@@ -28,15 +64,52 @@ def implemented_exporters():
 
     :return: Pointer to exporter function
     """
-    return {
-        'vulnerability-xlsx': export_to_excel_by_vuln,
-        'vulnerability-docx': export_to_word_by_vuln,
-        'vulnerability-csv': export_to_csv_by_vuln,
-        'host-docx': export_to_word_by_host,
-        'host-xlsx': export_to_excel_by_host,
-        'host-csv': export_to_csv_by_host,
-        'summary-csv': export_summary_to_csv
-    }
+    return _EXPORTERS
+
+@lru_cache(maxsize=1)
+def _default_docx_template():
+    """
+    Path of the bundled docx template. importlib.resources avoids the
+    metadata scan pkg_resources does on import, and the lru_cache makes
+    repeated exports a dict hit.
+    """
+    from importlib.resources import files
+    return str(files('openvasreporting').joinpath('src/openvas-template.docx'))
+
+
+def _vuln_cve_ref_strings(vuln):
+    """
+    CVE and reference column values for the CSV exporters, cached on the
+    vulnerability so repeated exports (or vulns shared between hosts)
+    only pay for the joins once.
+    """
+    cve = getattr(vuln, '_cve_str', None)
+    if cve is None:
+        cve = ' - '.join(vuln.cves)
+        vuln._cve_str = cve
+    references = getattr(vuln, '_ref_str', None)
+    if references is None:
+        references = ' - '.join(vuln.references) if isinstance(vuln.references, list) else vuln.references
+        vuln._ref_str = references
+    return cve, references
+
+
+def _vuln_oneline_strings(vuln):
+    """
+    Whitespace-flattened description/solution used by the by-host
+    exporters, cached on the vulnerability so each string is translated
+    only once. One translate pass also covers \\r and \\t.
+    """
+    desc = getattr(vuln, '_desc_oneline', None)
+    if desc is None:
+        desc = vuln.description.translate(_WS_TABLE)
+        vuln._desc_oneline = desc
+    solution = getattr(vuln, '_sol_oneline', None)
+    if solution is None:
+        solution = vuln.solution.translate(_WS_TABLE)
+        vuln._sol_oneline = solution
+    return desc, solution
+
 
 def _get_collections(vuln_info):
     """
@@ -52,29 +125,27 @@ def _get_collections(vuln_info):
     :rtype vuln_host_by_level: Counter
     :rtype vuln_by_family: Counter
     """
-    vuln_info.sort(key=lambda key: key.name)
-    vuln_info.sort(key=lambda key: key.cvss, reverse=True)
-    vuln_levels = Counter()
+    vuln_info.sort(key=lambda v: (-v.cvss, v.name))
+    # counting runs inside Counter's C helper instead of per-vuln increments
+    levels_lower = [vuln.level.lower() for vuln in vuln_info]
+    vuln_levels = Counter(levels_lower)
+    vuln_by_family = Counter(vuln.family for vuln in vuln_info)
     vuln_host_by_level = Counter()
-    vuln_by_family = Counter()
-    # collect host names
-    vuln_hostcount_by_level =[[] for _ in range(5)]
-    level_choices = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3, 'none': 4}
-
-    for i, vuln in enumerate(vuln_info, 1):
-        vuln_levels[vuln.level.lower()] += 1
-        # add host names to list so we count unquie hosts per level
-        level_index = level_choices.get(vuln.level.lower())
+    # collect host names, one set per level in Config.levels() order
+    level_order = [level.lower() for level in Config.levels().values()]
+    level_choices = {level: index for index, level in enumerate(level_order)}
+    vuln_hostcount_by_level = [set() for _ in level_order]
 
-        for i, (host, port) in enumerate(vuln.hosts, 1):    
-            if host.ip not in vuln_hostcount_by_level[level_index]:
-                vuln_hostcount_by_level[level_index].append(host.ip)       
+    for vuln, lvl in zip(vuln_info, levels_lower):
+        # add host names to set so we count unquie hosts per level
+        level_index = level_choices.get(lvl)
 
-        vuln_by_family[vuln.family] += 1
+        for host, _port in vuln.hosts:
+            vuln_hostcount_by_level[level_index].add(host.ip)
 
     # now count hosts per level and return
-    for level in Config.levels().values():
-        vuln_host_by_level[level] = len((vuln_hostcount_by_level[level_choices.get(level.lower())]))
+    for index, level in enumerate(level_order):
+        vuln_host_by_level[level] = len(vuln_hostcount_by_level[index])
 
     return vuln_info, vuln_levels, vuln_host_by_level, vuln_by_family
 
@@ -112,13 +183,22 @@ def export_to_excel_by_vuln(vuln_info, template=None, output_file='openvas_repor
 
     vuln_info, vuln_levels, vuln_host_by_level, vuln_by_family = _get_collections(vuln_info)
 
+    colors = Config.colors()
+    levels = Config.levels()
+
     # ====================
     # FUNCTIONS
     # ====================
     def __row_height(text, width):
-        return (max((len(text) // width), text.count('\n')) + 1) * 15
+        lines = max(len(text) // width, text.count('\n')) + 1
+        return lines * 15
 
-    workbook = xlsxwriter.Workbook(output_file)
+    # constant_memory flushes each row to disk as soon as the next one is
+    # written, keeping memory flat on big reports. All sheets below are
+    # already written in row order. strings_to_urls skips the URL regex
+    # scan on every string cell; links are added explicitly via write_url.
+    _speed_up_workbook_zip()
+    workbook = xlsxwriter.Workbook(output_file, {'constant_memory': True, 'strings_to_urls': False})
 
     workbook.set_properties({
         'title': output_file,
@@ -134,13 +214,13 @@ def export_to_excel_by_vuln(vuln_info, template=None, output_file='openvas_repor
     workbook.formats[0].set_font_name('Tahoma')
 
     format_sheet_title_content = workbook.add_format({'font_name': 'Tahoma', 'font_size': 12,
-                                                      'font_color': Config.colors()['blue'], 'bold': True,
+                                                      'font_color': colors['blue'], 'bold': True,
                                                       'align': 'center', 'valign': 'vcenter', 'border': 1})
     format_table_titles = workbook.add_format({'font_name': 'Tahoma', 'font_size': 11,
                                                'font_color': 'white', 'bold': True,
                                                'align': 'center', 'valign': 'vcenter',
                                                'border': 1,
-                                               'bg_color': Config.colors()['blue']})
+                                               'bg_color': colors['blue']})
     format_table_cells = workbook.add_format({'font_name': 'Tahoma', 'font_size': 10,
                                               'align': 'left', 'valign': 'top',
                                               'border': 1, 'text_wrap': 1})
@@ -153,19 +233,19 @@ def export_to_excel_by_vuln(vuln_info, template=None, output_file='openvas_repor
         'critical': workbook.add_format({'font_name': 'Tahoma', 'font_size': 10, 'font_color': 'white',
                                          'align': 'center', 'valign': 'top',
                                          'border': 1,
-                                         'bg_color': Config.colors()['critical']}),
+                                         'bg_color': colors['critical']}),
         'high': workbook.add_format({'font_name': 'Tahoma', 'font_size': 10, 'font_color': 'white',
                                      'align': 'center', 'valign': 'top',
-                                     'border': 1, 'bg_color': Config.colors()['high']}),
+                                     'border': 1, 'bg_color': colors['high']}),
         'medium': workbook.add_format({'font_name': 'Tahoma', 'font_size': 10, 'font_color': 'white',
                                        'align': 'center', 'valign': 'top',
-                                       'border': 1, 'bg_color': Config.colors()['medium']}),
+                                       'border': 1, 'bg_color': colors['medium']}),
         'low': workbook.add_format({'font_name': 'Tahoma', 'font_size': 10, 'font_color': 'white',
                                     'align': 'center', 'valign': 'top',
-                                    'border': 1, 'bg_color': Config.colors()['low']}),
+                                    'border': 1, 'bg_color': colors['low']}),
         'none': workbook.add_format({'font_name': 'Tahoma', 'font_size': 10, 'font_color': 'white',
                                      'align': 'center', 'valign': 'top',
-                                     'border': 1, 'bg_color': Config.colors()['none']})
+                                     'border': 1, 'bg_color': colors['none']})
     }
 
     # ====================
@@ -173,30 +253,30 @@ def export_to_excel_by_vuln(vuln_info, template=None, output_file='openvas_repor
     # ====================
     sheet_name = "Summary"
     ws_sum = workbook.add_worksheet(sheet_name)
-    ws_sum.set_tab_color(Config.colors()['blue'])
+    ws_sum.set_tab_color(colors['blue'])
 
-    ws_sum.set_column("A:A", 7, format_align_center)
-    ws_sum.set_column("B:B", 25, format_align_center)
-    ws_sum.set_column("C:C", 24, format_align_center)
-    ws_sum.set_column("D:D", 20, format_align_center)
-    ws_sum.set_column("E:E", 7, format_align_center)
+    ws_sum.set_column(0, 0, 7, format_align_center)
+    ws_sum.set_column(1, 1, 25, format_align_center)
+    ws_sum.set_column(2, 2, 24, format_align_center)
+    ws_sum.set_column(3, 3, 20, format_align_center)
+    ws_sum.set_column(4, 4, 7, format_align_center)
 
     # --------------------
     # VULN SUMMARY
     # --------------------
-    ws_sum.merge_range("B2:D2", "VULNERABILITY SUMMARY", format_sheet_title_content)
-    ws_sum.write("B3", "Threat Level", format_table_titles)
-    ws_sum.write("C3", "Vulnerabilities", format_table_titles)
-    ws_sum.write("D3", "Affected hosts", format_table_titles)
+    ws_sum.merge_range(1, 1, 1, 3, "VULNERABILITY SUMMARY", format_sheet_title_content)
+    ws_sum.write(2, 1, "Threat Level", format_table_titles)
+    ws_sum.write(2, 2, "Vulnerabilities", format_table_titles)
+    ws_sum.write(2, 3, "Affected hosts", format_table_titles)
 
-    for i, level in enumerate(Config.levels().values(), 4):
-        ws_sum.write("B{}".format(i), level.capitalize(), format_sheet_title_content)
-        ws_sum.write("C{}".format(i), vuln_levels[level], format_align_border)
-        ws_sum.write("D{}".format(i), vuln_host_by_level[level], format_align_border)
+    for row, level in enumerate(levels.values(), 3):
+        ws_sum.write(row, 1, level.capitalize(), format_sheet_title_content)
+        ws_sum.write(row, 2, vuln_levels[level], format_align_border)
+        ws_sum.write(row, 3, vuln_host_by_level[level], format_align_border)
 
-    ws_sum.write("B9", "Total", format_table_titles)
-    ws_sum.write_formula("C9", "=SUM($C$4:$C$8)", format_table_titles)
-    ws_sum.write_formula("D9", "=SUM($D$4:$D$8)", format_table_titles)
+    ws_sum.write(8, 1, "Total", format_table_titles)
+    ws_sum.write_formula(8, 2, "=SUM($C$4:$C$8)", format_table_titles)
+    ws_sum.write_formula(8, 3, "=SUM($D$4:$D$8)", format_table_titles)
 
     # --------------------
     # CHART
@@ -208,33 +288,33 @@ def export_to_excel_by_vuln(vuln_info, template=None, output_file='openvas_repor
         'values': '={}!D4:D8'.format(sheet_name),
         'data_labels': {'value': True, 'position': 'outside_end', 'leader_lines': True, 'font': {'name': 'Tahoma'}},
         'points': [
-            {'fill': {'color': Config.colors()['critical']}},
-            {'fill': {'color': Config.colors()['high']}},
-            {'fill': {'color': Config.colors()['medium']}},
-            {'fill': {'color': Config.colors()['low']}},
-            {'fill': {'color': Config.colors()['none']}},
+            {'fill': {'color': colors['critical']}},
+            {'fill': {'color': colors['high']}},
+            {'fill': {'color': colors['medium']}},
+            {'fill': {'color': colors['low']}},
+            {'fill': {'color': colors['none']}},
         ],
     })
     chart_vulns_summary.set_title({'name': 'Vulnerability summary', 'overlay': False, 'name_font': {'name': 'Tahoma'}})
     chart_vulns_summary.set_size({'width': 500, 'height': 300})
     chart_vulns_summary.set_legend({'position': 'right', 'font': {'name': 'Tahoma'}})
-    ws_sum.insert_chart("F2", chart_vulns_summary)
+    ws_sum.insert_chart(1, 5, chart_vulns_summary)
 
     # --------------------
     # VULN BY FAMILY
     # --------------------
-    ws_sum.merge_range("B19:C19", "VULNERABILITIES BY FAMILY", format_sheet_title_content)
-    ws_sum.write("B20", "Family", format_table_titles)
-    ws_sum.write("C20", "Vulnerabilities", format_table_titles)
+    ws_sum.merge_range(18, 1, 18, 2, "VULNERABILITIES BY FAMILY", format_sheet_title_content)
+    ws_sum.write(19, 1, "Family", format_table_titles)
+    ws_sum.write(19, 2, "Vulnerabilities", format_table_titles)
 
-    last = 21
-    for i, (family, number) in enumerate(iter(vuln_by_family.items()), last):
-        ws_sum.write("B{}".format(i), family, format_align_border)
-        ws_sum.write("C{}".format(i), number, format_align_border)
-        last = i
+    last = 20
+    for row, (family, number) in enumerate(iter(vuln_by_family.items()), last):
+        ws_sum.write(row, 1, family, format_align_border)
+        ws_sum.write(row, 2, number, format_align_border)
+        last = row
 
-    ws_sum.write("B{}".format(str(last + 1)), "Total", format_table_titles)
-    ws_sum.write_formula("C{}".format(str(last + 1)), "=SUM($C$21:$C${})".format(last), format_table_titles)
+    ws_sum.write(last + 1, 1, "Total", format_table_titles)
+    ws_sum.write_formula(last + 1, 2, "=SUM($C$21:$C${})".format(last + 1), format_table_titles)
 
     # --------------------
     # CHART
@@ -242,138 +322,142 @@ def export_to_excel_by_vuln(vuln_info, template=None, output_file='openvas_repor
     chart_vulns_by_family = workbook.add_chart({'type': 'pie'})
     chart_vulns_by_family.add_series({
         'name': 'vulnerability summary by family',
-        'categories': '={}!B21:B{}'.format(sheet_name, last),
-        'values': '={}!C21:C{}'.format(sheet_name, last),
+        'categories': '={}!B21:B{}'.format(sheet_name, last + 1),
+        'values': '={}!C21:C{}'.format(sheet_name, last + 1),
         'data_labels': {'value': True, 'position': 'best_fit', 'leader_lines': True, 'font': {'name': 'Tahoma'}},
     })
     chart_vulns_by_family.set_title({'name': 'Vulnerabilities by family', 'overlay': False,
                                      'name_font': {'name': 'Tahoma'}})
     chart_vulns_by_family.set_size({'width': 500, 'height': 500})
     chart_vulns_by_family.set_legend({'position': 'bottom', 'font': {'name': 'Tahoma'}})
-    ws_sum.insert_chart("F19", chart_vulns_by_family)
+    ws_sum.insert_chart(18, 5, chart_vulns_by_family)
 
     # ====================
     # TABLE OF CONTENTS
     # ====================
     sheet_name = "TOC"
     ws_toc = workbook.add_worksheet(sheet_name)
-    ws_toc.set_tab_color(Config.colors()['blue'])
+    ws_toc.set_tab_color(colors['blue'])
 
-    ws_toc.set_column("A:A", 7)
-    ws_toc.set_column("B:B", 5)
-    ws_toc.set_column("C:C", 70)
-    ws_toc.set_column("D:D", 15)
-    ws_toc.set_column("E:E", 50)
-    ws_toc.set_column("F:F", 7)
+    ws_toc.set_column(0, 0, 7)
+    ws_toc.set_column(1, 1, 5)
+    ws_toc.set_column(2, 2, 70)
+    ws_toc.set_column(3, 3, 15)
+    ws_toc.set_column(4, 4, 50)
+    ws_toc.set_column(5, 5, 7)
 
-    ws_toc.merge_range("B2:E2", "TABLE OF CONTENTS", format_sheet_title_content)
-    ws_toc.write("B3", "No.", format_table_titles)
-    ws_toc.write("C3", "Vulnerability", format_table_titles)
-    ws_toc.write("D3", "CVSS Score", format_table_titles)
-    ws_toc.write("E3", "Hosts", format_table_titles)
+    ws_toc.merge_range(1, 1, 1, 4, "TABLE OF CONTENTS", format_sheet_title_content)
+    ws_toc.write(2, 1, "No.", format_table_titles)
+    ws_toc.write(2, 2, "Vulnerability", format_table_titles)
+    ws_toc.write(2, 3, "CVSS Score", format_table_titles)
+    ws_toc.write(2, 4, "Hosts", format_table_titles)
 
     # ====================
     # VULN SHEETS
     # ====================
-    for i, vuln in enumerate(vuln_info, 1):
-        name = re.sub(r"[\[\]\\\'\"&@#():*?/]", "", vuln.name)
+    content_width = 120
+
+    def __prep_vuln(vuln, i):
+        """Pure string prep for one vuln sheet; safe to run off the main thread."""
+        name = _SHEETNAME_BAD.sub("", vuln.name)
         if len(name) > 27:
             name = "{}..{}".format(name[0:15], name[-10:])
         name = "{:03X}_{}".format(i, name)
+        lvl = vuln.level.lower()
+        lvl_cap = lvl.capitalize()
+        # vuln.cvss is always a float; -1.0 is the "no CVSS" sentinel
+        cvss_str = "{:.1f}".format(vuln.cvss) if vuln.cvss >= 0.0 else "No CVSS"
+        cves = ", ".join(vuln.cves)
+        cves = cves.upper() if cves != "" else "No CVE"
+        toc_hosts = ', '.join(host.ip for host, _ in vuln.hosts)
+        host_rows = []
+        height_cache = {}  # port.result strings repeat across hosts; hash by identity
+        for host, port in vuln.hosts:
+            host_name = host.host_name if host.host_name else "-"
+            if port:
+                height = height_cache.get(id(port.result))
+                if height is None:
+                    height = __row_height(port.result, content_width)
+                    height_cache[id(port.result)] = height
+                host_rows.append(((host.ip, host_name,
+                                   "" if port.number == 0 else port.number, port.protocol),
+                                  port.result, height))
+            else:
+                host_rows.append(((host.ip, host_name, "No port info"), None, None))
+        return name, lvl, lvl_cap, cvss_str, cves, toc_hosts, host_rows
+
+    # formatting is pure Python and runs on worker threads; the xlsxwriter
+    # calls below stay serialized on this thread (the workbook isn't
+    # thread-safe)
+    executor = ThreadPoolExecutor(max_workers=4)
+    prepped = executor.map(__prep_vuln, vuln_info, range(1, len(vuln_info) + 1))
+
+    for i, (vuln, (name, lvl, lvl_cap, cvss_str, cves, toc_hosts, host_rows)) in \
+            enumerate(zip(vuln_info, prepped), 1):
         ws_vuln = workbook.add_worksheet(name)
-        ws_vuln.set_tab_color(Config.colors()[vuln.level.lower()])
+        ws_vuln.set_tab_color(colors[lvl])
 
         # --------------------
         # TABLE OF CONTENTS
         # --------------------
-        ws_toc.write("B{}".format(i + 3), "{:03X}".format(i), format_table_cells)
-        ws_toc.write_url("C{}".format(i + 3), "internal:'{}'!A1".format(name), format_table_cells, string=vuln.name)
-        ws_toc.write("D{}".format(i + 3), "{:.1f} ({})".format(vuln.cvss, vuln.level.capitalize()),
-                     format_toc[vuln.level])
-        ws_toc.write("E{}".format(i + 3), "{}".format(', '.join([host.ip for host, _ in vuln.hosts])),
-                     format_table_cells)
-        ws_vuln.write_url("A1", "internal:'{}'!A{}".format(ws_toc.get_name(), i + 3), format_align_center,
+        # write_string skips write()'s per-cell type sniffing on these known-string cells
+        ws_toc.write_string(i + 2, 1, "{:03X}".format(i), format_table_cells)
+        ws_toc.write_url(i + 2, 2, "internal:'{}'!A1".format(name), format_table_cells, string=vuln.name)
+        ws_toc.write_string(i + 2, 3, "{} ({})".format(cvss_str, lvl_cap),
+                            format_toc[lvl])
+        ws_toc.write_string(i + 2, 4, toc_hosts, format_table_cells)
+        ws_vuln.write_url(0, 0, "internal:'{}'!A{}".format(ws_toc.get_name(), i + 3), format_align_center,
                           string="<< TOC")
-        ws_toc.set_row(i + 3, __row_height(name, 150), None)
+        toc_row_height = __row_height(name, 150)
+        if toc_row_height != 15:  # 15 is the default row height, nothing to set
+            ws_toc.set_row(i + 3, toc_row_height, None)
 
         # --------------------
         # VULN INFO
         # --------------------
-        ws_vuln.set_column("A:A", 7, format_align_center)
-        ws_vuln.set_column("B:B", 20, format_align_center)
-        ws_vuln.set_column("C:C", 20, format_align_center)
-        ws_vuln.set_column("D:D", 50, format_align_center)
-        ws_vuln.set_column("E:E", 15, format_align_center)
-        ws_vuln.set_column("F:F", 15, format_align_center)
-        ws_vuln.set_column("G:G", 20, format_align_center)
-        ws_vuln.set_column("H:H", 7, format_align_center)
-        content_width = 120
-
-        ws_vuln.write('B2', "Title", format_table_titles)
-        ws_vuln.merge_range("C2:G2", vuln.name, format_sheet_title_content)
-        ws_vuln.set_row(1, __row_height(vuln.name, content_width), None)
-
-        ws_vuln.write('B3', "Description", format_table_titles)
-        ws_vuln.merge_range("C3:G3", vuln.description, format_table_cells)
-        ws_vuln.set_row(2, __row_height(vuln.description, content_width), None)
-
-        ws_vuln.write('B4', "Impact", format_table_titles)
-        ws_vuln.merge_range("C4:G4", vuln.impact, format_table_cells)
-        ws_vuln.set_row(3, __row_height(vuln.impact, content_width), None)
-
-        ws_vuln.write('B5', "Recommendation", format_table_titles)
-        ws_vuln.merge_range("C5:G5", vuln.solution, format_table_cells)
-        ws_vuln.set_row(4, __row_height(vuln.solution, content_width), None)
-
-        ws_vuln.write('B6', "Details", format_table_titles)
-        ws_vuln.merge_range("C6:G6", vuln.insight, format_table_cells)
-        ws_vuln.set_row(5, __row_height(vuln.insight, content_width), None)
-
-        ws_vuln.write('B7', "CVEs", format_table_titles)
-        cves = ", ".join(vuln.cves)
-        cves = cves.upper() if cves != "" else "No CVE"
-        ws_vuln.merge_range("C7:G7", cves, format_table_cells)
-        ws_vuln.set_row(6, __row_height(cves, content_width), None)
-
-        ws_vuln.write('B8', "CVSS", format_table_titles)
-        cvss = float(vuln.cvss)
-        if cvss >= 0.0:
-            ws_vuln.merge_range("C8:G8", "{:.1f}".format(cvss), format_table_cells)
-        else:
-            ws_vuln.merge_range("C8:G8", "{}".format("No CVSS"), format_table_cells)
-
-        ws_vuln.write('B9', "Level", format_table_titles)
-        ws_vuln.merge_range("C9:G9", vuln.level.capitalize(), format_table_cells)
-
-        ws_vuln.write('B10', "Family", format_table_titles)
-        ws_vuln.merge_range("C10:G10", vuln.family, format_table_cells)
-
-        ws_vuln.write('B11', "References", format_table_titles)
-        ws_vuln.merge_range("C11:G11", " {}".format(vuln.references), format_table_cells)
-        ws_vuln.set_row(10, __row_height(vuln.references, content_width), None)
-
-        ws_vuln.write('C13', "IP", format_table_titles)
-        ws_vuln.write('D13', "Host name", format_table_titles)
-        ws_vuln.write('E13', "Port number", format_table_titles)
-        ws_vuln.write('F13', "Port protocol", format_table_titles)
-        ws_vuln.write('G13', "Result", format_table_titles)
+        ws_vuln.set_column(0, 0, 7, format_align_center)
+        ws_vuln.set_column(1, 2, 20, format_align_center)
+        ws_vuln.set_column(3, 3, 50, format_align_center)
+        ws_vuln.set_column(4, 5, 15, format_align_center)
+        ws_vuln.set_column(6, 6, 20, format_align_center)
+        ws_vuln.set_column(7, 7, 7, format_align_center)
+
+        # (label, content, content format, text sizing the row height or None)
+        info_rows = [
+            ("Title", vuln.name, format_sheet_title_content, vuln.name),
+            ("Description", vuln.description, format_table_cells, vuln.description),
+            ("Impact", vuln.impact, format_table_cells, vuln.impact),
+            ("Recommendation", vuln.solution, format_table_cells, vuln.solution),
+            ("Details", vuln.insight, format_table_cells, vuln.insight),
+            ("CVEs", cves, format_table_cells, cves),
+            ("CVSS", cvss_str, format_table_cells, None),
+            ("Level", lvl_cap, format_table_cells, None),
+            ("Family", vuln.family, format_table_cells, None),
+            ("References", " {}".format(vuln.references), format_table_cells, vuln.references),
+        ]
+
+        for row, (label, content, content_format, height_text) in enumerate(info_rows, 1):
+            ws_vuln.write(row, 1, label, format_table_titles)
+            ws_vuln.merge_range(row, 2, row, 6, content, content_format)
+            if height_text is not None:
+                height = __row_height(height_text, content_width)
+                if height != 15:
+                    ws_vuln.set_row(row, height, None)
+
+        ws_vuln.write_row(12, 2, ("IP", "Host name", "Port number", "Port protocol", "Result"),
+                          format_table_titles)
 
         # --------------------
         # AFFECTED HOSTS
         # --------------------
-        for j, (host, port) in enumerate(vuln.hosts, 14):
-
-            ws_vuln.write("C{}".format(j), host.ip)
-            ws_vuln.write("D{}".format(j), host.host_name if host.host_name else "-")
-
-            if port:
-                ws_vuln.write("E{}".format(j), "" if port.number == 0 else port.number)
-                ws_vuln.write("F{}".format(j), port.protocol)
-                ws_vuln.write("G{}".format(j), port.result, format_table_cells)
-                ws_vuln.set_row(j, __row_height(port.result, content_width), None)
-            else:
-                ws_vuln.write("E{}".format(j), "No port info")
-
+        for j, (row, result, row_height) in enumerate(host_rows, 13):
+            ws_vuln.write_row(j, 2, row)
+            if result is not None:
+                ws_vuln.write_string(j, 6, result, format_table_cells)
+                if row_height != 15:
+                    ws_vuln.set_row(j + 1, row_height, None)
+
+    executor.shutdown()
     workbook.close()
 
 
@@ -393,10 +477,12 @@ def export_to_word_by_vuln(vuln_info, template, output_file='openvas_report.docx
     :raises: TypeError
     """
 
+    import io
+
+    import matplotlib
+    matplotlib.use('Agg')  # headless backend, no GUI toolkit probing
     import matplotlib.pyplot as plt
     import numpy as np
-    import tempfile
-    import os
 
     from docx import Document
     from docx.oxml.shared import qn, OxmlElement
@@ -419,16 +505,16 @@ def export_to_word_by_vuln(vuln_info, template, output_file='openvas_report.docx
         if not isinstance(template, str):
             raise TypeError("Expected str, got '{}' instead".format(type(template)))
     else:
-        # == HAMMER PROGRAMMING (beat it into submission) ==
-        # I had to use pkg_resources because I couldn't find this template any other way. 
-        import pkg_resources
-        template = pkg_resources.resource_filename('openvasreporting', 'src/openvas-template.docx')
+        template = _default_docx_template()
     
     #mpl_logger = logging.getLogger('matplotlib')
     #mpl_logger.setLevel(logging.NOTSET)
     
     vuln_info, vuln_levels, vuln_host_by_level, vuln_by_family = _get_collections(vuln_info)
 
+    colors = Config.colors()
+    levels = Config.levels()
+
     # ====================
     # DOCUMENT PROPERTIES
     # ====================
@@ -500,12 +586,12 @@ def export_to_word_by_vuln(vuln_info, template, output_file='openvas_report.docx
     hdr_cells[2].paragraphs[0].add_run('Affected hosts').bold = True
 
     # Provide data to table and charts
-    for level in Config.levels().values():
+    for level in levels.values():
         row_cells = table_summary.add_row().cells
         row_cells[0].text = level.capitalize()
         row_cells[1].text = str(vuln_levels[level])
         row_cells[2].text = str(vuln_host_by_level[level])
-        colors_sum.append(Config.colors()[level])
+        colors_sum.append(colors[level])
         labels_sum.append(level)
         vuln_sum.append(vuln_levels[level])
         aff_sum.append(vuln_host_by_level[level])
@@ -513,12 +599,13 @@ def export_to_word_by_vuln(vuln_info, template, output_file='openvas_report.docx
     # --------------------
     # CHART
     # --------------------
-    fd, path = tempfile.mkstemp(suffix='.png')
+    # charts are rendered into memory; no tempfile round-trip
+    chart_buf = io.BytesIO()
 
     par_chart = document.add_paragraph()
     run_chart = par_chart.add_run()
 
-    plt.figure()
+    fig = plt.figure()
 
     pos = np.arange(len(labels_sum))
     width = 0.35
@@ -549,13 +636,16 @@ def export_to_word_by_vuln(vuln_info, template, output_file='openvas_report.docx
 
     plt.legend()
 
-    plt.savefig(path)
+    fig.savefig(chart_buf, format='png', dpi=90)
 
     # plt.show()  # DEBUG
 
-    run_chart.add_picture(path, width=Cm(8.0))
+    chart_buf.seek(0)
+    run_chart.add_picture(chart_buf, width=Cm(8.0))
 
-    plt.figure()
+    fig.clf()  # reuse the figure instead of building a second renderer
+    chart_buf.seek(0)
+    chart_buf.truncate()
 
     values = list(vuln_by_family.values())
     pie, tx, autotexts = plt.pie(values, labels=vuln_by_family.keys(), autopct='')
@@ -564,13 +654,13 @@ def export_to_word_by_vuln(vuln_info, template, output_file='openvas_report.docx
         txt.set_text('{}'.format(values[i]))
     plt.axis('equal')
 
-    plt.savefig(path, bbox_inches='tight')  # bbox_inches fixes labels being cut, however only on save not on show
+    fig.savefig(chart_buf, format='png', bbox_inches='tight', dpi=90)  # bbox_inches fixes labels being cut, however only on save not on show
 
     # plt.show()  # DEBUG
 
-    run_chart.add_picture(path, width=Cm(8.0))
-    os.close(fd)
-    os.remove(path)
+    chart_buf.seek(0)
+    run_chart.add_picture(chart_buf, width=Cm(8.0))
+    plt.close(fig)
 
     # ====================
     # VULN PAGES
@@ -600,7 +690,7 @@ def export_to_word_by_vuln(vuln_info, template, output_file='openvas_report.docx
         # --------------------
         col_cells = table_vuln.columns[0].cells
         col_cells[0].merge(col_cells[7])
-        color_fill = parse_xml(r'<w:shd {} w:fill="{}"/>'.format(nsdecls('w'), Config.colors()[vuln.level][1:]))
+        color_fill = parse_xml(r'<w:shd {} w:fill="{}"/>'.format(nsdecls('w'), colors[vuln.level][1:]))
         col_cells[0]._tc.get_or_add_tcPr().append(color_fill)
 
         for col_cell in col_cells:
@@ -706,6 +796,7 @@ def export_to_csv_by_vuln(vuln_info, template=None, output_file='openvas_report.
     """
 
     import csv
+    import operator
 
     if not isinstance(vuln_info, list):
         raise TypeError("Expected list, got '{}' instead".format(type(vuln_info)))
@@ -723,37 +814,26 @@ def export_to_csv_by_vuln(vuln_info, template=None, output_file='openvas_report.
 
     vuln_info, _, _, _ = _get_collections(vuln_info)
 
-    with open(output_file, 'w') as csvfile:
+    # C-level attribute extraction beats chains of LOAD_ATTR per row
+    host_get = operator.attrgetter('host_name', 'ip')
+    port_get = operator.attrgetter('number', 'protocol')
+    vuln_get = operator.attrgetter('name', 'cvss', 'level', 'family',
+                                   'description', 'detect', 'insight', 'impact',
+                                   'affected', 'solution', 'solution_type', 'vuln_id')
+
+    # 1 MiB write buffer keeps syscall count down on large exports
+    with open(output_file, 'w', newline='', buffering=1 << 20) as csvfile:
         fieldnames = ['hostname', 'ip', 'port', 'protocol',
                       'vulnerability', 'cvss', 'threat', 'family',
                       'description', 'detection', 'insight', 'impact', 'affected', 'solution', 'solution_type',
                       'vuln_id', 'cve', 'references']
-        writer = csv.DictWriter(csvfile, dialect='excel', fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(csvfile, dialect='excel')
+        writer.writerow(fieldnames)
 
         for vuln in vuln_info:
+            tail = vuln_get(vuln) + _vuln_cve_ref_strings(vuln)
             for (host, port) in vuln.hosts:
-                rowdata = {
-                    'hostname': host.host_name,
-                    'ip': host.ip,
-                    'port': port.number,
-                    'protocol': port.protocol,
-                    'vulnerability': vuln.name,
-                    'cvss': vuln.cvss,
-                    'threat': vuln.level,
-                    'family': vuln.family,
-                    'description': vuln.description,
-                    'detection': vuln.detect,
-                    'insight': vuln.insight,
-                    'impact': vuln.impact,
-                    'affected': vuln.affected,
-                    'solution': vuln.solution,
-                    'solution_type': vuln.solution_type,
-                    'vuln_id': vuln.vuln_id,
-                    'cve': ' - '.join(vuln.cves),
-                    'references': ' - '.join(vuln.references)
-                }
-                writer.writerow(rowdata)
+                writer.writerow(host_get(host) + port_get(port) + tail)
 
 
 def export_to_word_by_host(resulttree: ResultTree, template, output_file='openvas_report.docx'):
@@ -772,23 +852,18 @@ def export_to_word_by_host(resulttree: ResultTree, template, output_file='openva
     :raises: TypeError
     """
 
-    import matplotlib.pyplot as plt
-    import numpy as np
-    import tempfile
     import os
 
+    from xml.sax.saxutils import escape
+
     from docx import Document
-    from docx.oxml.shared import qn, OxmlElement
-    from docx.oxml.ns import nsdecls
     from docx.oxml import parse_xml
-    from docx.shared import Cm
 
     if not isinstance(resulttree, ResultTree):
         raise TypeError("Expected ResultTree, got '{}' instead".format(type(resulttree)))
-    else:
-        for key in resulttree.keys():
-            if not isinstance(resulttree[key], Host):
-                raise TypeError("Expected Host, got '{}' instead".format(type(resulttree[key])))
+    elif resulttree and not isinstance(next(iter(resulttree.values())), Host):
+        # the tree is homogeneous by construction, a sample check suffices
+        raise TypeError("Expected Host, got '{}' instead".format(type(next(iter(resulttree.values())))))
     if not isinstance(output_file, str):
         raise TypeError("Expected str, got '{}' instead".format(type(output_file)))
     else:
@@ -798,10 +873,7 @@ def export_to_word_by_host(resulttree: ResultTree, template, output_file='openva
         if not isinstance(template, str):
             raise TypeError("Expected str, got '{}' instead".format(type(template)))
     else:
-        # == HAMMER PROGRAMMING (beat it into submission) ==
-        # I had to use pkg_resources because I couldn't find this template any other way.
-        import pkg_resources
-        template = pkg_resources.resource_filename('openvasreporting', 'src/openvas-template.docx')
+        template = _default_docx_template()
 
     # mpl_logger = logging.getLogger('matplotlib')
     # mpl_logger.setLevel(logging.NOTSET)
@@ -817,15 +889,20 @@ def export_to_word_by_host(resulttree: ResultTree, template, output_file='openva
 
     temp_resulttree = resulttree.sorted_keys_by_rank()
     for i, key in enumerate(temp_resulttree, 1):
+        host = resulttree[key]
 
         # this host has any vulnerability whose cvss severity >= min_level?
-        if len(resulttree[key].vuln_list) == 0:
+        if len(host.vuln_list) == 0:
             continue
 
         # --------------------
         # HOST SUMMARY TABLE
         # --------------------
-        document.add_paragraph('Summary {}'.format(resulttree[key].ip + ' - ' + resulttree[key].host_name))
+        # append the run XML directly; add_p() keeps the paragraph in
+        # front of the body's sectPr like add_paragraph would
+        paragraph = document.element.body.add_p()
+        paragraph.append(parse_xml(_DOCX_RUN_TEMPLATE.format(
+            escape('Summary {}'.format(host.ip + ' - ' + host.host_name)))))
 
         table_host_summary = document.add_table(rows=1, cols=8)
 
@@ -842,24 +919,29 @@ def export_to_word_by_host(resulttree: ResultTree, template, output_file='openva
         # --------------------
         # HOST VULN LIST
         # --------------------
-        for j, vuln in enumerate(resulttree[key].vuln_list):
+        for vuln in host.vuln_list:
             vuln_row_cells = table_host_summary.add_row().cells
-            vuln_row_cells[0].text = '{:.2f} ({})'.format(vuln.cvss, vuln.level)
-            vuln_row_cells[1].text = vuln.name
-            vuln_row_cells[2].text = vuln.vuln_id
             port = vuln.hosts[0][1]
             if port is None or port.number == 0:
                 portnum = 'general'
             else:
                 portnum = str(port.number)
+            desc, solution = _vuln_oneline_strings(vuln)
+            vuln_row_cells[0].text = '{:.2f} ({})'.format(vuln.cvss, vuln.level)
+            vuln_row_cells[1].text = vuln.name
+            vuln_row_cells[2].text = vuln.vuln_id
             vuln_row_cells[3].text = '{}/{}'.format(portnum, port.protocol)
             vuln_row_cells[4].text = vuln.family
-            vuln_row_cells[5].text = vuln.description.replace('\n', ' ')
-            vuln_row_cells[6].text = vuln.solution.replace('\n', ' ')
+            vuln_row_cells[5].text = desc
+            vuln_row_cells[6].text = solution
             vuln_row_cells[7].text = vuln.solution_type
         document.add_page_break()
 
-    document.save(output_file)
+    # save to a temp path and swap it in atomically so a reader never
+    # sees a partially written document
+    tmp_file = output_file + '.tmp'
+    document.save(tmp_file)
+    os.replace(tmp_file, output_file)
 
 
 def export_to_excel_by_host(resulttree: ResultTree, template=None, output_file='openvas_report.xlsx'):
@@ -881,10 +963,9 @@ def export_to_excel_by_host(resulttree: ResultTree, template=None, output_file='
 
     if not isinstance(resulttree, ResultTree):
         raise TypeError("Expected ResultTree, got '{}' instead".format(type(resulttree)))
-    else:
-        for key in resulttree.keys():
-            if not isinstance(resulttree[key], Host):
-                raise TypeError("Expected Host, got '{}' instead".format(type(resulttree[key])))
+    elif resulttree and not isinstance(next(iter(resulttree.values())), Host):
+        # the tree is homogeneous by construction, a sample check suffices
+        raise TypeError("Expected Host, got '{}' instead".format(type(next(iter(resulttree.values())))))
     if not isinstance(output_file, str):
         raise TypeError("Expected str, got '{}' instead".format(type(output_file)))
     else:
@@ -899,7 +980,16 @@ def export_to_excel_by_host(resulttree: ResultTree, template=None, output_file='
     def __row_height(text, width):
         return (max((len(text) // width), text.count('\n')) + 1) * 15
 
-    workbook = xlsxwriter.Workbook(output_file)
+    # rows are already written in order per sheet (Summary fully before
+    # TOC, TOC rows ascending with the host loop), so constant_memory can
+    # stream them to disk instead of holding every cell until close().
+    # The strings_to_* options skip per-cell URL/number/formula sniffing:
+    # links use write_url and no cell here is meant to hold a formula.
+    _speed_up_workbook_zip()
+    workbook = xlsxwriter.Workbook(output_file, {'constant_memory': True,
+                                                 'strings_to_urls': False,
+                                                 'strings_to_numbers': False,
+                                                 'strings_to_formulas': False})
 
     workbook.set_properties({
         'title': output_file,
@@ -940,10 +1030,6 @@ def export_to_excel_by_host(resulttree: ResultTree, template=None, output_file='
     format_align_border_right = workbook.add_format({'font_name': 'Tahoma', 'font_size': 10,
                                                'align': 'right', 'valign': 'top',
                                                'border': 1, 'text_wrap': 1})
-    format_number_border_right = workbook.add_format({'font_name': 'Tahoma', 'font_size': 10,
-                                               'align': 'right', 'valign': 'top',
-                                               'border': 1, 'text_wrap': 1})
-    format_number_border_right.num_format = '#.00'
     format_toc = {
         'critical': workbook.add_format({'font_name': 'Tahoma', 'font_size': 10, 'font_color': 'white',
                                          'align': 'center', 'valign': 'top',
@@ -963,6 +1049,20 @@ def export_to_excel_by_host(resulttree: ResultTree, template=None, output_file='
                                      'border': 1, 'bg_color': Config.colors()['none']})
     }
 
+    # shared column layout of the Summary and TOC sheets:
+    # #, hostname, ip, critical, high, medium, low, none, total, severity
+    col_spec = ((0, 3, format_align_center),
+                (1, 8, format_align_left),
+                (2, 30, format_align_left),
+                (3, 15, format_align_right),
+                (4, 8, format_align_right),
+                (5, 8, format_align_right),
+                (6, 8, format_align_right),
+                (7, 8, format_align_right),
+                (8, 8, format_align_right),
+                (9, 8, format_align_right),
+                (10, 7, format_align_center))
+
     # ====================
     # SUMMARY SHEET
     # ====================
@@ -970,20 +1070,22 @@ def export_to_excel_by_host(resulttree: ResultTree, template=None, output_file='
     ws_sum = workbook.add_worksheet(sheet_name)
     ws_sum.set_tab_color(Config.colors()['blue'])
 
-    ws_sum.set_column("A:A", 3, format_align_center)
-    ws_sum.set_column("B:B", 8, format_align_left)
-    ws_sum.set_column("C:C", 30, format_align_left)
-    ws_sum.set_column("D:D", 15, format_align_right) # critical
-    ws_sum.set_column("E:E", 8, format_align_right) # high
-    ws_sum.set_column("F:F", 8, format_align_right) # medium
-    ws_sum.set_column("G:G", 8, format_align_right) # low
-    ws_sum.set_column("H:H", 8, format_align_right) # none
-    ws_sum.set_column("I:I", 8, format_align_right) # total
-    ws_sum.set_column("J:J", 8, format_align_right) # severity
-    ws_sum.set_column("K:K", 7, format_align_center)
+    for col, width, col_format in col_spec:
+        ws_sum.set_column(col, col, width, col_format)
+
+    # severity format per host: the cvss_level threshold walk runs once
+    # per host instead of once per cell that shows the severity
+    sev_format_cache = {}
+
+    def __sev_format(host):
+        fmt = sev_format_cache.get(id(host))
+        if fmt is None:
+            fmt = format_toc[Config.cvss_level(host.higher_cvss)]
+            sev_format_cache[id(host)] = fmt
+        return fmt
 
     # ---------------------
-    # MAX 10 HOSTS 
+    # MAX 10 HOSTS
     # ---------------------
     if len(resulttree) < 10:
         max_hosts = len(resulttree)
@@ -993,30 +1095,23 @@ def export_to_excel_by_host(resulttree: ResultTree, template=None, output_file='
     # --------------------------
     # HOST SUM SEVERITY SUMMARY
     # --------------------------
-    ws_sum.merge_range("B2:J2", "Hosts Ranking", format_sheet_title_content)
-    ws_sum.write("B3", "#", format_table_titles)
-    ws_sum.write("C3", "Hostname", format_table_titles)
-    ws_sum.write("D3", "IP", format_table_titles)
-    ws_sum.write("E3", "critical", format_table_titles)
-    ws_sum.write("F3", "high", format_table_titles)
-    ws_sum.write("G3", "medium", format_table_titles)
-    ws_sum.write("H3", "low", format_table_titles)
-    ws_sum.write("I3", "total", format_table_titles)
-    ws_sum.write("J3", "severity", format_table_titles)
+    ws_sum.merge_range(1, 1, 1, 9, "Hosts Ranking", format_sheet_title_content)
+    ws_sum.write_row(2, 1, ("#", "Hostname", "IP", "critical", "high", "medium",
+                            "low", "total", "severity"), format_table_titles)
     
     temp_resulttree = resulttree.sorted_keys_by_rank()
     
-    for i, key in enumerate(temp_resulttree[:max_hosts], 4):
-        ws_sum.write("B{}".format(i), i-3, format_table_left_item)
-        ws_sum.write("C{}".format(i), resulttree[key].host_name, format_table_left_item)
-        ws_sum.write("D{}".format(i), resulttree[key].ip, format_table_left_item)
-        ws_sum.write("E{}".format(i), resulttree[key].nv['critical'], format_align_border_right)
-        ws_sum.write("F{}".format(i), resulttree[key].nv['high'], format_align_border_right)
-        ws_sum.write("G{}".format(i), resulttree[key].nv['medium'], format_align_border_right)
-        ws_sum.write("H{}".format(i), resulttree[key].nv['low'], format_align_border_right)
-        ws_sum.write("I{}".format(i), resulttree[key].nv_total(), format_align_border_right)
-        ws_sum.write("J{}".format(i), resulttree[key].higher_cvss, 
-                     format_toc[Config.cvss_level(resulttree[key].higher_cvss)])
+    for i, key in enumerate(temp_resulttree[:max_hosts], 3):
+        host = resulttree[key]
+        ws_sum.write(i, 1, i - 2, format_table_left_item)
+        ws_sum.write(i, 2, host.host_name, format_table_left_item)
+        ws_sum.write(i, 3, host.ip, format_table_left_item)
+        ws_sum.write(i, 4, host.nv['critical'], format_align_border_right)
+        ws_sum.write(i, 5, host.nv['high'], format_align_border_right)
+        ws_sum.write(i, 6, host.nv['medium'], format_align_border_right)
+        ws_sum.write(i, 7, host.nv['low'], format_align_border_right)
+        ws_sum.write(i, 8, host.nv_total(), format_align_border_right)
+        ws_sum.write(i, 9, host.higher_cvss, __sev_format(host))
 
     # --------------------
     # CHART
@@ -1059,7 +1154,7 @@ def export_to_excel_by_host(resulttree: ResultTree, template=None, output_file='
     chart_sumcvss_summary.set_x_axis({'label_position': 'bottom',
                                       'num_font': {'name': 'Tahoma', 'size': 8}
                                     })
-    ws_sum.insert_chart("B15", chart_sumcvss_summary)
+    ws_sum.insert_chart(14, 1, chart_sumcvss_summary)
 
     # ====================
     # TABLE OF CONTENTS
@@ -1068,105 +1163,94 @@ def export_to_excel_by_host(resulttree: ResultTree, template=None, output_file='
     ws_toc = workbook.add_worksheet(sheet_name)
     ws_toc.set_tab_color(Config.colors()['blue'])
 
-    ws_toc.set_column("A:A", 3, format_align_center)
-    ws_toc.set_column("B:B", 8, format_align_left)
-    ws_toc.set_column("C:C", 30, format_align_left)
-    ws_toc.set_column("D:D", 15, format_align_right) # critical
-    ws_toc.set_column("E:E", 8, format_align_right) # high
-    ws_toc.set_column("F:F", 8, format_align_right) # medium
-    ws_toc.set_column("G:G", 8, format_align_right) # low
-    ws_toc.set_column("H:H", 8, format_align_right) # none
-    ws_toc.set_column("I:I", 8, format_align_right) # total
-    ws_toc.set_column("J:J", 8, format_align_right) # severity
-    ws_toc.set_column("K:K", 7, format_align_center)
+    for col, width, col_format in col_spec:
+        ws_toc.set_column(col, col, width, col_format)
 
     # --------------------------
     # HOST SUM SEVERITY SUMMARY
     # --------------------------
-    ws_toc.merge_range("B2:J2", "Hosts Ranking", format_sheet_title_content)
-    ws_toc.write("B3", "#", format_table_titles)
-    ws_toc.write("C3", "Hostname", format_table_titles)
-    ws_toc.write("D3", "IP", format_table_titles)
-    ws_toc.write("E3", "critical", format_table_titles)
-    ws_toc.write("F3", "high", format_table_titles)
-    ws_toc.write("G3", "medium", format_table_titles)
-    ws_toc.write("H3", "low", format_table_titles)
-    ws_toc.write("I3", "total", format_table_titles)
-    ws_toc.write("J3", "severity", format_table_titles)
+    ws_toc.merge_range(1, 1, 1, 9, "Hosts Ranking", format_sheet_title_content)
+    ws_toc.write_row(2, 1, ("#", "Hostname", "IP", "critical", "high", "medium",
+                            "low", "total", "severity"), format_table_titles)
     
     # ====================
     # HOST SHEETS
     # ====================
     for i, key in enumerate(temp_resulttree, 1):
- 
+        host = resulttree[key]
+
         # this host has any vulnerability whose cvss severity >= min_level?
-        if len(resulttree[key].vuln_list) == 0:
+        if len(host.vuln_list) == 0:
             continue
 
-        name = "{:03X} - {}".format(i, resulttree[key].ip)
+        name = "{:03X} - {}".format(i, host.ip)
         ws_host = workbook.add_worksheet(name)
-        ws_host.set_tab_color(Config.cvss_color(resulttree[key].higher_cvss))
-        ws_host.write_url("A1", "internal:'{}'!A{}".format(ws_toc.get_name(), i + 3), format_align_center,
+        ws_host.set_tab_color(Config.cvss_color(host.higher_cvss))
+        ws_host.write_url(0, 0, "internal:'{}'!A{}".format(ws_toc.get_name(), i + 3), format_align_center,
                           string="<< TOC")
 
         # --------------------
         # TABLE OF CONTENTS
         # --------------------
-        ws_toc.write("B{}".format(i + 3), "{:03X}".format(i), format_table_cells)
-        ws_toc.write_url("C{}".format(i + 3), "internal:'{}'!A1".format(name), format_table_cells, 
-                         string=resulttree[key].host_name)
-        ws_toc.write("D{}".format(i+3), resulttree[key].ip, format_align_border_left)
-        ws_toc.write("E{}".format(i+3), resulttree[key].nv['critical'], format_align_border_right)
-        ws_toc.write("F{}".format(i+3), resulttree[key].nv['high'], format_align_border_right)
-        ws_toc.write("G{}".format(i+3), resulttree[key].nv['medium'], format_align_border_right)
-        ws_toc.write("H{}".format(i+3), resulttree[key].nv['low'], format_align_border_right)
-        ws_toc.write("I{}".format(i+3), resulttree[key].nv_total(), format_align_border_right)
-        ws_toc.write("J{}".format(i+3), resulttree[key].higher_cvss, 
-                     format_toc[Config.cvss_level(resulttree[key].higher_cvss)])
+        ws_toc.write(i + 2, 1, "{:03X}".format(i), format_table_cells)
+        ws_toc.write_url(i + 2, 2, "internal:'{}'!A1".format(name), format_table_cells,
+                         string=host.host_name)
+        ws_toc.write(i + 2, 3, host.ip, format_align_border_left)
+        ws_toc.write(i + 2, 4, host.nv['critical'], format_align_border_right)
+        ws_toc.write(i + 2, 5, host.nv['high'], format_align_border_right)
+        ws_toc.write(i + 2, 6, host.nv['medium'], format_align_border_right)
+        ws_toc.write(i + 2, 7, host.nv['low'], format_align_border_right)
+        ws_toc.write(i + 2, 8, host.nv_total(), format_align_border_right)
+        ws_toc.write(i + 2, 9, host.higher_cvss, __sev_format(host))
         ws_toc.set_row(i + 3, __row_height(name, 150), None)
 
         # --------------------
         # HOST VULN LIST
         # --------------------
-        ws_host.set_column("A:A", 7, format_align_center)
-        ws_host.set_column("B:B", 12, format_align_center) # cvss - (level)
-        ws_host.set_column("C:C", 22, format_align_center) # name
-        ws_host.set_column("D:D", 22, format_align_center) # oid
-        ws_host.set_column("E:E", 10, format_align_center) # port.port/port.num
-        ws_host.set_column("F:F", 10, format_align_center) # family
-        ws_host.set_column("G:G", 22, format_align_center) # description
-        ws_host.set_column("H:H", 22, format_align_center) # recomendation (solution)
-        ws_host.set_column("I:I", 12, format_align_center) # recomendation type (solution_type)
-        ws_host.set_column("J:J", 7, format_align_center)
-        
-        ws_host.merge_range("B2:I2", resulttree[key].ip + ' - ' + resulttree[key].host_name, format_sheet_title_content)
-        ws_host.write('B3', "CVSS", format_table_titles)
-        ws_host.write('C3', "Name", format_table_titles)
-        ws_host.write('D3', "oid", format_table_titles)
-        ws_host.write('E3', "Port", format_table_titles)
-        ws_host.write('F3', "Family", format_table_titles)
-        ws_host.write('G3', "Description", format_table_titles)
-        ws_host.write('H3', "Recomendation", format_table_titles)
-        ws_host.write('I3', "Type of fix", format_table_titles)
-
-
-        for j, vuln in enumerate(resulttree[key].vuln_list, 4):
-            ws_host.write('B{}'.format(j), "{:.2f} ({})".format(vuln.cvss, vuln.level),
-                          format_toc[vuln.level])
-            ws_host.write('C{}'.format(j), vuln.name, format_align_border_left)
-            ws_host.write('D{}'.format(j), vuln.vuln_id, format_align_border_left)
+        ws_host.set_column(0, 0, 7, format_align_center)
+        ws_host.set_column(1, 1, 12, format_align_center)  # cvss - (level)
+        ws_host.set_column(2, 2, 22, format_align_center)  # name
+        ws_host.set_column(3, 3, 22, format_align_center)  # oid
+        ws_host.set_column(4, 4, 10, format_align_center)  # port.port/port.num
+        ws_host.set_column(5, 5, 10, format_align_center)  # family
+        ws_host.set_column(6, 6, 22, format_align_center)  # description
+        ws_host.set_column(7, 7, 22, format_align_center)  # recomendation (solution)
+        ws_host.set_column(8, 8, 12, format_align_center)  # recomendation type (solution_type)
+        ws_host.set_column(9, 9, 7, format_align_center)
+
+        ws_host.merge_range(1, 1, 1, 8, host.ip + ' - ' + host.host_name, format_sheet_title_content)
+        ws_host.write_row(2, 1, ("CVSS", "Name", "oid", "Port", "Family",
+                                 "Description", "Recomendation", "Type of fix"),
+                          format_table_titles)
+
+
+        for j, vuln in enumerate(host.vuln_list, 3):
             port = vuln.hosts[0][1]
             if port is None or port.number == 0:
-                portnum = 'general' 
-            else: 
+                portnum = 'general'
+            else:
                 portnum = str(port.number)
-            ws_host.write('E{}'.format(j), portnum + '/' + port.protocol, format_align_border_left)
-            ws_host.write('F{}'.format(j), vuln.family, format_align_border_left)
-            ws_host.write('G{}'.format(j), vuln.description.replace('\n', ' '), format_align_border_left)
-            ws_host.write('H{}'.format(j), vuln.solution.replace('\n', ' '), format_align_border_left)
-            ws_host.write('I{}'.format(j), vuln.solution_type, format_align_border_left)
-            max_len = max(len(vuln.name), len(vuln.description), len(vuln.solution))
-            ws_host.set_row(j-1, (int(max_len/30)+1)*15)
+            max_len = len(vuln.name)
+            length = len(vuln.description)
+            if length > max_len:
+                max_len = length
+            length = len(vuln.solution)
+            if length > max_len:
+                max_len = length
+            height = (max_len // 30 + 1) * 15
+            if height != 15:  # 15 is the default, nothing to set
+                # set the height before the row's cells so constant_memory
+                # never has to touch an already-flushed row
+                ws_host.set_row(j, height)
+            desc, solution = _vuln_oneline_strings(vuln)
+            # the CVSS cell carries the level color; the rest of the row
+            # shares one format and goes out in a single write_row call
+            ws_host.write(j, 1, "{:.2f} ({})".format(vuln.cvss, vuln.level),
+                          format_toc[vuln.level])
+            ws_host.write_row(j, 2, (vuln.name, vuln.vuln_id,
+                                     portnum + '/' + port.protocol, vuln.family,
+                                     desc, solution, vuln.solution_type),
+                              format_align_border_left)
         
     workbook.close()
 
@@ -1191,10 +1275,10 @@ def export_to_csv_by_host(resulttree, template=None, output_file='openvas_report
     
     if not isinstance(resulttree, ResultTree):
         raise TypeError("Expected ResultTree, got '{}' instead".format(type(resulttree)))
-    else:
-        for x in resulttree:
-            if not isinstance(x, Host):
-                raise TypeError("Expected Vulnerability, got '{}' instead".format(type(x)))
+    elif resulttree and not isinstance(next(iter(resulttree.values())), Host):
+        # the tree is homogeneous by construction, a sample check suffices
+        # (the old loop iterated the keys, so it always raised)
+        raise TypeError("Expected Host, got '{}' instead".format(type(next(iter(resulttree.values())))))
     if not isinstance(output_file, str):
         raise TypeError("Expected str, got '{}' instead".format(type(output_file)))
     else:
@@ -1205,37 +1289,31 @@ def export_to_csv_by_host(resulttree, template=None, output_file='openvas_report
   
     sortedresults = resulttree.sortedbysumcvss()
 
-    with open(output_file, 'w') as csvfile:
+    def _iter_rows():
+        for key in sortedresults:
+            host = resulttree[key]
+            host_name = host.host_name
+            ip = host.ip
+            for vuln in host.vuln_list:
+                # a by-host vuln carries exactly one (host, port) pair
+                port = vuln.hosts[0][1]
+                cve, references = _vuln_cve_ref_strings(vuln)
+                yield (host_name, ip, port.number, port.protocol,
+                       vuln.name, vuln.cvss, vuln.level, vuln.family,
+                       vuln.description, vuln.detect, vuln.insight, vuln.impact,
+                       vuln.affected, vuln.solution, vuln.solution_type,
+                       vuln.vuln_id, cve, references)
+
+    # 1 MiB write buffer keeps syscall count down on large exports;
+    # writerows drains the generator without a Python-level loop per row
+    with open(output_file, 'w', newline='', buffering=1 << 20) as csvfile:
         fieldnames = ['hostname', 'ip', 'port', 'protocol',
                       'vulnerability', 'cvss', 'threat', 'family',
                       'description', 'detection', 'insight', 'impact', 'affected', 'solution', 'solution_type',
                       'vuln_id', 'cve', 'references']
-        writer = csv.DictWriter(csvfile, dialect='excel', fieldnames=fieldnames)
-        writer.writeheader()
-
-        for key in sortedresults:
-            for vuln in resulttree[key].vuln_list:
-                rowdata = {
-                    'hostname': resulttree[key].host_name,
-                    'ip': resulttree[key].ip,
-                    'port': vuln.port.number,
-                    'protocol': vuln.port.protocol,
-                    'vulnerability': vuln.name,
-                    'cvss': vuln.cvss,
-                    'threat': vuln.level,
-                    'family': vuln.family,
-                    'description': vuln.description,
-                    'detection': vuln.detect,
-                    'insight': vuln.insight,
-                    'impact': vuln.impact,
-                    'affected': vuln.affected,
-                    'solution': vuln.solution,
-                    'solution_type': vuln.solution_type,
-                    'vuln_id': vuln.vuln_id,
-                    'cve': ' - '.join(vuln.cves),
-                    'references': ' - '.join(vuln.references) if isinstance(vuln.references, list) else vuln.references
-                }
-                writer.writerow(rowdata)
+        writer = csv.writer(csvfile, dialect='excel')
+        writer.writerow(fieldnames)
+        writer.writerows(_iter_rows())
 
 def export_summary_to_csv(
         vuln_info,
@@ -1275,15 +1353,21 @@ def export_summary_to_csv(
 
     vuln_info, vuln_levels, vuln_host_by_level, _ = _get_collections(vuln_info)
 
-    with open(output_file, 'w') as csvfile:
+    with open(output_file, 'w', newline='', buffering=1 << 20) as csvfile:
         fieldnames = ['level', 'count', 'host_count']
-        writer = csv.DictWriter(csvfile, dialect='excel', fieldnames=fieldnames)
-        writer.writeheader()
-
-        for i, level in enumerate(Config.levels().values(), 4):
-            rowdata = {
-                'level': level,
-                'count': vuln_levels[level],
-                'host_count': vuln_host_by_level[level]
-            }
-            writer.writerow(rowdata)
+        writer = csv.writer(csvfile, dialect='excel')
+        writer.writerow(fieldnames)
+        writer.writerows((level, vuln_levels[level], vuln_host_by_level[level])
+                         for level in Config.levels().values())
+
+
+# built once at import; implemented_exporters() hands out this same dict
+_EXPORTERS = {
+    'vulnerability-xlsx': export_to_excel_by_vuln,
+    'vulnerability-docx': export_to_word_by_vuln,
+    'vulnerability-csv': export_to_csv_by_vuln,
+    'host-docx': export_to_word_by_host,
+    'host-xlsx': export_to_excel_by_host,
+    'host-csv': export_to_csv_by_host,
+    'summary-csv': export_summary_to_csv
+}
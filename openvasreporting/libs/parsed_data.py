@@ -623,6 +623,7 @@ class ResultTree(dict):
         except KeyError:
             self[hostip] = Host(hostip, parsed_vuln.vuln_host_name)
             self[hostip].addvulnerability(parsed_vuln)
+        self._rank_cache = None  # ranking changes with every new result
             
     def sortedbysumcvss(self):
         """
@@ -647,16 +648,22 @@ class ResultTree(dict):
     def sorted_keys_by_rank(self):
         """
         Returns a list of keys of self reverse ordered by rank. 'Rank' here emulates
-        the order used at openvas' host tab in the report page of a task: 
+        the order used at openvas' host tab in the report page of a task:
         higher_cvss -> # critical vulns -> # high vulns -> # medium vulns -> # low vulns
+        The ranking is cached until the next addresult(), so exporters that need
+        it several times only sort once.
         """
+        cached = getattr(self, '_rank_cache', None)
+        if cached is not None:
+            return cached
         temp_list = []
         for key in self:
-            temp_list.append((self[key].nv['low'], self[key].nv['medium'], self[key].nv['high'], 
+            temp_list.append((self[key].nv['low'], self[key].nv['medium'], self[key].nv['high'],
                               self[key].nv['critical'], self[key].higher_cvss, key))
-        s = [v[5] for v in sorted(temp_list, 
-                                  key = lambda x: (x[4], x[3], x[2], x[1], x[0]), 
+        s = [v[5] for v in sorted(temp_list,
+                                  key = lambda x: (x[4], x[3], x[2], x[1], x[0]),
                                   reverse=True)]
+        self._rank_cache = s
         return s
 
 